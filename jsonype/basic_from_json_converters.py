@@ -1,14 +1,25 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from inspect import isclass
+from itertools import repeat
 from types import NoneType
-from typing import (Any, Callable, Generic, Iterable, Literal, Mapping, Optional, Protocol,
+from typing import (Any, Callable, Collection, Generic, Literal, Mapping, Optional, Protocol,
                     Sequence, TypeVar, Union, cast, get_args, runtime_checkable)
 
 from jsonype.base_types import Json, JsonSimple
+from jsonype.identity_cache import identity_cache
 
 TargetType = TypeVar("TargetType")
 ContainedTargetType = TypeVar("ContainedTargetType")
 
+_JSON_SIMPLE: tuple[type, ...] = get_args(JsonSimple)
+_JSON_SIMPLE_OR_NONE: tuple[type, ...] = (*_JSON_SIMPLE, NoneType)
+# Union and Literal are type-special-forms and thus cannot be compared to a type
+_UNION_SENTINEL = cast(type, Union)
+_LITERAL_SENTINEL = cast(type, Literal)
+# the args-descriptor of BaseException that stores args at the C-level
+_BASE_EXCEPTION_ARGS = BaseException.__dict__["args"]
+
 
 class FromJsonConversionError(ValueError):
     def __init__(self, js: Json, target_type: type, reason: str | None = None) -> None:
@@ -16,6 +27,67 @@ class FromJsonConversionError(ValueError):
                          js, target_type)
 
 
+class _UnionConversionError(FromJsonConversionError):
+    """Raised by :class:`ToUnion` if none of the alternatives can be converted.
+
+    The failures of the alternatives are only formatted into the message when ``args`` (or
+    ``str`` or ``repr``) is accessed. If the ``Union`` is itself an alternative of an outer
+    ``Union`` this error is mostly discarded, and formatting all nested failures can be
+    expensive. Once formatted it has the same ``args`` as a :class:`FromJsonConversionError`
+    and copies or pickles as one.
+    """
+
+    def __init__(self,  # pylint: disable=super-init-not-called
+                 js: Json,
+                 target_type: type,
+                 failures: Sequence[tuple[type, ValueError]]) -> None:
+        # FromJsonConversionError.__init__ would format the message right away. Until args
+        # is accessed the args stored by BaseException.__new__ are the arguments of this call.
+        for _, failure in failures:
+            # the frames of the failed conversions are not needed for the message
+            failure.__traceback__ = None
+        self._formatted = False
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        args: tuple[Any, ...] = _BASE_EXCEPTION_ARGS.__get__(self)
+        if not self._formatted:
+            js, target_type, failures = args
+            args = FromJsonConversionError(js, target_type, str(list(failures))).args
+            self.args = args
+        return args
+
+    @args.setter
+    def args(self, args: tuple[Any, ...]) -> None:
+        self._formatted = True
+        _BASE_EXCEPTION_ARGS.__set__(self, args)
+
+    def __str__(self) -> str:
+        """Return the same as for a :class:`FromJsonConversionError`."""
+        # BaseException.__str__ reads the args stored at the C-level, so they are formatted first
+        _ = self.args
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        """Return the same as for a :class:`FromJsonConversionError`.
+
+        The ``repr`` of a failure is part of the message of an outer ``Union``, so this keeps
+        these messages independent of the lazy formatting.
+        """
+        return f"{FromJsonConversionError.__name__}{self.args!r}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild a :class:`FromJsonConversionError` from the formatted ``args``."""
+        return _conversion_error_from_args, (self.args,)
+
+
+def _conversion_error_from_args(args: tuple[Any, ...]) -> FromJsonConversionError:
+    # FromJsonConversionError.__init__ would format args again
+    error = FromJsonConversionError.__new__(FromJsonConversionError)
+    error.args = args
+    return error
+
+
 class UnsupportedTargetTypeError(ValueError):
     def __init__(self, target_type: type, reason: str | None = None) -> None:
         super().__init__(
@@ -109,30 +181,31 @@ class ToUnion(FromJsonConverter[TargetType, TargetType]):
     """
 
     def can_convert(self, target_type: type, origin_of_generic: Optional[type]) -> bool:
-        # Union is a type-special-form and thus cannot be compared to a type
-        return origin_of_generic is cast(type, Union)
+        return origin_of_generic is _UNION_SENTINEL
 
     def convert(self,
                 js: Json,
                 target_type: type[TargetType],
                 annotations: Mapping[str, type],
                 from_json: Callable[[Json, type[TargetType]], TargetType]) -> TargetType:
-        union_types = get_args(target_type)
-        # a str is also a Sequence of str so check str first to avoid that
-        # it gets converted to a Sequence of str
-        union_types_with_str_first = (([str] if str in union_types else [])
-                                      + [ty for ty in union_types if ty is not str])
-        args: Iterable[tuple[Json, type[Json]]] = ((js, ty) for ty in union_types_with_str_first)
-        res_or_failures = _first_success(from_json, args)
-        if res_or_failures \
-                and isinstance(res_or_failures, list) \
-                and all(isinstance(e, ValueError) for e in res_or_failures):
-            raise FromJsonConversionError(
-                js, target_type, str(list(zip(union_types_with_str_first, res_or_failures)))
-            )
-        # here we know that one conversion was successful. As we only convert into the
-        # type-parameters of the Union the returned result must be of the Union-type
-        return cast(TargetType, res_or_failures)
+        union_types_with_str_first = _ordered_union_args(target_type)
+        # a simple value or None is returned unchanged by any alternative that accepts it,
+        # so if its exact type is an alternative there is no need to try them one by one
+        if type(js) in _JSON_SIMPLE_OR_NONE and type(js) in union_types_with_str_first:
+            # js is of one of the type-parameters
+            return cast(TargetType, js)
+        # the list is only allocated once a conversion fails
+        failures: Optional[list[ValueError]] = None
+        for ty in union_types_with_str_first:
+            try:
+                return from_json(js, ty)
+            except ValueError as e:  # noqa: PERF203
+                if failures is None:
+                    failures = []
+                failures.append(e)
+        raise _UnionConversionError(
+            js, target_type, list(zip(union_types_with_str_first, failures or ()))
+        )
 
 
 class ToLiteral(FromJsonConverter[TargetType, None]):
@@ -146,15 +219,14 @@ class ToLiteral(FromJsonConverter[TargetType, None]):
     """
 
     def can_convert(self, target_type: type, origin_of_generic: Optional[type]) -> bool:
-        # Literal is a type-special-form and thus cannot be compared to a type
-        return origin_of_generic is cast(type, Literal)
+        return origin_of_generic is _LITERAL_SENTINEL
 
     def convert(self,
                 js: Json,
                 target_type: type[TargetType],
                 annotations: Mapping[str, type],
                 from_json: Callable[[Json, type[None]], None]) -> TargetType:
-        literals = get_args(target_type)
+        literals = _cached_get_args(target_type)
         if js in literals:
             # as js is one of the literals it must be of the Literal[literals]-type
             return cast(TargetType, js)
@@ -183,7 +255,9 @@ class ToSimple(FromJsonConverter[TargetType, None]):
     """Return the JSON-representation, if it is one of the types ``int, float, str, bool``."""
 
     def can_convert(self, target_type: type, origin_of_generic: Optional[type]) -> bool:
-        return isclass(target_type) and issubclass(target_type, get_args(JsonSimple))
+        # only fall back to the more expensive check for subclasses of the simple types
+        return (target_type in _JSON_SIMPLE
+                or (isclass(target_type) and issubclass(target_type, _JSON_SIMPLE)))
 
     def convert(self,
                 js: Json,
@@ -219,19 +293,19 @@ class ToTuple(FromJsonConverter[tuple[Any, ...], Any]):
                 target_type: type[tuple[Any, ...]],
                 annotations: Mapping[str, type],
                 from_json: Callable[[Json, type[Any]], Any]) -> tuple[Any, ...]:
-        element_types: Sequence[Any] = get_args(target_type)
-        if element_types.count(...) > 1:
-            raise UnsupportedTargetTypeError(target_type,
-                                             "tuple must not have more than one ... parameter")
-        if isinstance(js, Sequence):
-            element_types = _replace_ellipsis(element_types, len(js))
+        element_types, ellipsis_idx = _tuple_plan(target_type)
+        # JSON-arrays are typically lists and checking the concrete type first is much cheaper
+        # than the isinstance check against the abstract Sequence
+        if type(js) is list or type(js) is tuple or isinstance(js, Sequence):
+            if ellipsis_idx is not None:
+                element_types = _tuple_types_for_len(target_type, len(js))
             if len(js) != len(element_types):
                 raise FromJsonConversionError(
                     js,
                     target_type,
                     f"Number of elements: {len(js)} not equal to tuple-size {len(element_types)}"
                 )
-            return tuple(from_json(e, ty) for e, ty in zip(js, element_types))
+            return tuple(map(from_json, js, element_types))
         raise FromJsonConversionError(js, target_type)
 
 
@@ -246,7 +320,7 @@ class ToList(FromJsonConverter[Sequence[TargetType], TargetType]):
     """
 
     def can_convert(self, target_type: type, origin_of_generic: Optional[type]) -> bool:
-        return ((isclass(origin_of_generic) and issubclass(cast(type, origin_of_generic), Sequence))
+        return ((isclass(origin_of_generic) and issubclass(origin_of_generic, Sequence))
                 or (isclass(target_type) and issubclass(target_type, Sequence)))
 
     def convert(self,
@@ -254,10 +328,19 @@ class ToList(FromJsonConverter[Sequence[TargetType], TargetType]):
                 target_type: type[Sequence[TargetType]],
                 annotations: Mapping[str, type],
                 from_json: Callable[[Json, type[TargetType]], TargetType]) -> Sequence[TargetType]:
-        element_types = get_args(target_type) or (Any,)
+        element_types = _cached_get_args(target_type) or (Any,)
         assert len(element_types) == 1
-        if isinstance(js, Sequence):
-            return [from_json(e, element_types[0]) for e in js]
+        element_type = element_types[0]
+        if type(js) is list or type(js) is tuple or isinstance(js, Sequence):
+            # avoid dispatching each element through from_json if it would be returned unchanged.
+            # The element type is compared by equality in a tuple as hashing it may fail.
+            if element_type in _JSON_SIMPLE:
+                _check_simple(js, element_type)
+            elif element_type is not Any and element_type is not object:
+                return list(map(from_json, js, repeat(element_type)))
+            # the elements are returned unchanged, so the copy is annotated instead of cast
+            elements: list[Any] = list(js)
+            return elements
         raise FromJsonConversionError(js, target_type)
 
 
@@ -271,7 +354,7 @@ class ToMapping(FromJsonConverter[Mapping[str, TargetType], TargetType]):
     """
 
     def can_convert(self, target_type: type, origin_of_generic: Optional[type]) -> bool:
-        return isclass(origin_of_generic) and issubclass(cast(type, origin_of_generic), Mapping)
+        return isclass(origin_of_generic) and issubclass(origin_of_generic, Mapping)
 
     def convert(
             self,
@@ -280,12 +363,18 @@ class ToMapping(FromJsonConverter[Mapping[str, TargetType], TargetType]):
             annotations: Mapping[str, type],
             from_json: Callable[[Json, type[TargetType]], TargetType]
     ) -> Mapping[str, TargetType]:
-        key_value_types = get_args(target_type) or (str, Any)
-        key_type, value_type = key_value_types
-        if key_type is not str:
-            raise UnsupportedTargetTypeError(target_type, "Mapping must have str key-type")
-        if isinstance(js, Mapping):
-            return {k: from_json(v, value_type) for k, v in js.items()}
+        value_type = _mapping_value_type(target_type)
+        if type(js) is dict or isinstance(js, Mapping):
+            if not js:
+                return {}
+            # as for ToList values that would be returned unchanged are not dispatched
+            if value_type in _JSON_SIMPLE:
+                _check_simple(js.values(), value_type)
+            elif value_type is not Any and value_type is not object:
+                return {k: from_json(v, value_type) for k, v in js.items()}
+            # the values are returned unchanged, so the copy is annotated instead of cast
+            entries: dict[str, Any] = dict(js)
+            return entries
         raise FromJsonConversionError(js, target_type)
 
 
@@ -332,42 +421,85 @@ class ToTypedMapping(FromJsonConverter[Mapping[str, TargetType], TargetType]):
             annotations: Mapping[str, type[TargetType]],
             from_json: Callable[[Json, type[TargetType]], TargetType]
     ) -> Mapping[str, TargetType]:
-        def type_for_key(k: str) -> type[TargetType]:
-            t = annotations.get(k)
-            if t:
-                return t
-            raise FromJsonConversionError(js, target_type, f"Unknown key: {k}")
-
-        if isinstance(js, Mapping) and isinstance(target_type, HasRequiredKeys):
-            if target_type.__required_keys__.issubset(frozenset(js.keys())):
-                items = js.items() if self.strict \
-                    else [(k, v) for k, v in js.items() if k in annotations]
-                return {k: from_json(v, type_for_key(k)) for k, v in items}
-            raise FromJsonConversionError(js, cast(type, target_type),
-                                          f"Required key missing: {target_type.__required_keys__}")
+        required_keys = _required_keys(target_type)
+        if (type(js) is dict or isinstance(js, Mapping)) and required_keys is not None:
+            if required_keys <= js.keys():
+                if self.strict and not js.keys() <= annotations.keys():
+                    unknown_key = next(k for k in js if k not in annotations)
+                    raise FromJsonConversionError(js, target_type, f"Unknown key: {unknown_key}")
+                return {k: from_json(v, annotations[k]) for k, v in js.items() if k in annotations}
+            raise FromJsonConversionError(js, target_type, f"Required key missing: {required_keys}")
         raise FromJsonConversionError(js, target_type)
 
 
-def _first_success(f: Callable[..., ContainedTargetType], i: Iterable[tuple[TargetType, ...]]) \
-        -> Union[ContainedTargetType, Sequence[ValueError]]:
-    failures: list[ValueError] = []
-    for args in i:
-        try:
-            return f(*args)
-        except ValueError as e:  # noqa: PERF203
-            failures.append(e)
-    return failures
+# the type-parameters only depend on the target type, but converting a large array
+# asks for them once per element
+_cached_get_args: Callable[[Any], tuple[Any, ...]] = identity_cache(maxsize=1024)(get_args)
+
+
+def _union_args_with_str_first(union_type: Any) -> tuple[Any, ...]:
+    union_types = _cached_get_args(union_type)
+    # a str is also a Sequence of str so check str first to avoid that
+    # it gets converted to a Sequence of str
+    return (((str,) if str in union_types else ())
+            + tuple(ty for ty in union_types if ty is not str))
+
+
+_ordered_union_args: Callable[[Any], tuple[Any, ...]] = \
+    identity_cache(maxsize=256)(_union_args_with_str_first)
+
+
+def _check_simple(js: Collection[Json], simple_type: type) -> None:
+    # map and all run the isinstance checks without executing python bytecode per element.
+    # Only if one fails the elements are iterated again to report the offending one.
+    if all(map(isinstance, js, repeat(simple_type))):
+        return
+    for e in js:
+        if not isinstance(e, simple_type):
+            raise FromJsonConversionError(e, simple_type)
+
+
+def _element_types_and_ellipsis_idx(tuple_type: Any) -> tuple[tuple[Any, ...], Optional[int]]:
+    element_types = _cached_get_args(tuple_type)
+    if element_types.count(...) > 1:
+        raise UnsupportedTargetTypeError(tuple_type,
+                                         "tuple must not have more than one ... parameter")
+    return element_types, element_types.index(...) if ... in element_types else None
+
+
+_tuple_plan: Callable[[Any], tuple[tuple[Any, ...], Optional[int]]] = \
+    identity_cache(maxsize=256)(_element_types_and_ellipsis_idx)
+
+
+def _str_key_mapping_value_type(mapping_type: Any) -> Any:
+    key_type, value_type = _cached_get_args(mapping_type) or (str, Any)
+    if key_type is not str:
+        raise UnsupportedTargetTypeError(mapping_type, "Mapping must have str key-type")
+    return value_type
+
+
+_mapping_value_type: Callable[[Any], Any] = \
+    identity_cache(maxsize=256)(_str_key_mapping_value_type)
+
+
+def _required_keys_of_typed_dict(mapping_type: Any) -> Optional[frozenset[str]]:
+    # isinstance against a runtime_checkable Protocol is much more expensive than
+    # the conversion itself, so it is only done once per type
+    return mapping_type.__required_keys__ if isinstance(mapping_type, HasRequiredKeys) else None
+
+
+_required_keys: Callable[[Any], Optional[frozenset[str]]] = \
+    lru_cache(maxsize=256)(_required_keys_of_typed_dict)
 
 
-def _replace_ellipsis(element_types: Sequence[Any], expected_len: int) -> Sequence[Any]:
-    if ... in element_types:
-        element_types = _fill_ellipsis(element_types, expected_len, object)
-    return element_types
+def _fill_ellipsis(tuple_type: Any, expected_len: int) -> tuple[Any, ...]:
+    types, ellipsis_idx = _tuple_plan(tuple_type)
+    if ellipsis_idx is None:
+        return types
+    return (types[:ellipsis_idx]
+            + (object,) * (expected_len - len(types) + 1)
+            + types[ellipsis_idx + 1:])
 
 
-def _fill_ellipsis(types: Sequence[Any], expected_len: int, fill_type: type[TargetType]) \
-        -> Sequence[type[TargetType]]:
-    types = list(types)
-    ellipsis_idx = types.index(...)
-    types[ellipsis_idx:ellipsis_idx + 1] = [fill_type] * (expected_len - len(types) + 1)
-    return types
+_tuple_types_for_len: Callable[[Any, int], tuple[Any, ...]] = \
+    identity_cache(maxsize=128)(_fill_ellipsis)
@@ -0,0 +1,38 @@
+from typing import Any, Callable, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+def identity_cache(maxsize: int) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Cache the results of a function by the identity of its first argument.
+
+    Results computed from types cannot be cached by equality of the types (as
+    :func:`functools.lru_cache` does): ``Union[int, str]`` and ``Union[str, int]`` compare and
+    hash equal, but the order of their type-parameters matters for the conversion. This is also
+    true for types that contain such a ``Union`` like ``list[Union[int, str]]``.
+
+    Each entry keeps a reference to the first argument, so its id cannot be reused by another
+    object while the entry exists. Further positional arguments must be hashable and are compared
+    by equality. If the cache is full the oldest entry is dropped.
+
+    Args:
+        maxsize: the maximal number of cached results
+    Returns:
+        a decorator that caches the results of the decorated function
+    """
+
+    def decorator(f: Callable[..., R]) -> Callable[..., R]:
+        cache: dict[Hashable, tuple[Any, R]] = {}
+
+        def cached(first: Any, *args: Hashable) -> R:
+            key = (id(first), *args) if args else id(first)
+            entry = cache.get(key)
+            if entry is None:
+                if len(cache) >= maxsize:
+                    cache.pop(next(iter(cache)), None)
+                entry = cache[key] = (first, f(first, *args))
+            return entry[1]
+
+        return cached
+
+    return decorator
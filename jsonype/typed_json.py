@@ -1,15 +1,22 @@
+from collections import abc
+from functools import partial
 from inspect import get_annotations
-from typing import Any, TypeVar, cast, get_origin
+from types import NoneType
+from typing import (Any, Callable, Literal, Mapping, Sequence, TypeVar, Union, get_args,
+                    get_origin)
 
-from jsonype.base_types import Json
+from jsonype.base_types import Json, JsonSimple
 from jsonype.basic_from_json_converters import (FromJsonConverter, ToAny, ToList, ToLiteral,
                                                 ToMapping, ToNone, ToSimple, ToTuple,
                                                 ToTypedMapping, ToUnion, UnsupportedTargetTypeError)
 from jsonype.basic_to_json_converters import (FromMapping, FromNone, FromSequence, FromSimple,
                                               ToJsonConverter, UnsupportedSourceTypeError)
+from jsonype.identity_cache import identity_cache
 
 TargetType = TypeVar("TargetType")
 
+ResolvedConverter = Callable[[Json, Any, Mapping[str, type], Callable[[Json, Any], Any]], Any]
+
 
 class TypedJson:
     """Provides methods to convert python objects to/from a JSON-representation.
@@ -65,23 +72,64 @@ class TypedJson:
     """
 
     def __init__(self, strict: bool = False) -> None:
+        to_any: FromJsonConverter[Any, Any] = ToAny()
+        to_union: FromJsonConverter[Any, Any] = ToUnion()
+        to_literal: FromJsonConverter[Any, Any] = ToLiteral()
+        to_none: FromJsonConverter[Any, Any] = ToNone()
+        to_simple: FromJsonConverter[Any, Any] = ToSimple()
+        to_tuple: FromJsonConverter[Any, Any] = ToTuple()
+        to_list: FromJsonConverter[Any, Any] = ToList()
+        to_mapping: FromJsonConverter[Any, Any] = ToMapping()
         self._from_json_converters: tuple[FromJsonConverter[Any, Any], ...] = (
-            ToAny(),
-            ToUnion(),
-            ToLiteral(),
-            ToNone(),
-            ToSimple(),
-            ToTuple(),
-            ToList(),
-            ToMapping(),
+            to_any,
+            to_union,
+            to_literal,
+            to_none,
+            to_simple,
+            to_tuple,
+            to_list,
+            to_mapping,
             ToTypedMapping(strict),
         )
+        # For well-known target types and origins of generics the converter is looked up
+        # directly instead of asking each converter in turn. The entries must select the
+        # same converter as _from_json_converters would.
+        self._to_any = to_any
+        self._to_none = to_none
+        self._from_json_converter_by_type: dict[Any, FromJsonConverter[Any, Any]] = {
+            Any: to_any,
+            object: to_any,
+            NoneType: to_none,
+            None: to_none,
+            **{simple_type: to_simple for simple_type in get_args(JsonSimple)},
+        }
+        self._from_json_converter_by_origin: dict[Any, FromJsonConverter[Any, Any]] = {
+            Union: to_union,
+            Literal: to_literal,
+            tuple: to_tuple,
+            list: to_list,
+            abc.Sequence: to_list,
+            dict: to_mapping,
+            abc.Mapping: to_mapping,
+        }
         self._to_json_converters: tuple[ToJsonConverter[Any], ...] = (
             FromNone(),
             FromSimple(),
             FromSequence(),
             FromMapping(),
         )
+        # The converter and the annotations only depend on the target type, so resolve them
+        # once per type instead of once per converted JSON-node. The cache is keyed by identity
+        # as for example Union[int, str] equals int | str and Union[str, int], but they are not
+        # converted the same way. The cached function does not refer to self to avoid a
+        # reference cycle between this instance and its cache.
+        self._resolve_from_json: Callable[[Any], tuple[ResolvedConverter, Mapping[str, type]]] = \
+            identity_cache(maxsize=1024)(partial(
+                _resolve_from_json,
+                converters=self._from_json_converters,
+                converter_by_type=self._from_json_converter_by_type,
+                converter_by_origin=self._from_json_converter_by_origin,
+            ))
 
     def to_json(self, o: Any) -> Json:
         """Convert the given object to a JSON-representation.
@@ -119,12 +167,36 @@ class TypedJson:
             ValueError: If the JSON-representation cannot be converted as a converter
                 fails to convert it to an object of the required type.
         """
-        origin_of_generic = get_origin(target_type)
-        annotations = get_annotations(target_type) if target_type else {}
-        converter = next((conv for conv in self._from_json_converters if
-                          conv.can_convert(target_type, origin_of_generic)),
-                         None)
-        if not converter:
-            raise UnsupportedTargetTypeError(target_type)
-        # converter can_convert from type[T] so it should return T
-        return cast(TargetType, converter.convert(js, target_type, annotations, self.from_json))
+        # These target types do not have annotations so they can skip looking them up. They are
+        # compared by identity as hashing a target type like a Literal is expensive or may fail.
+        convert: ResolvedConverter
+        annotations: Mapping[str, type]
+        if target_type is Any or target_type is object:
+            convert, annotations = self._to_any.convert, {}
+        elif target_type is NoneType or target_type is None:
+            convert, annotations = self._to_none.convert, {}
+        else:
+            convert, annotations = self._resolve_from_json(target_type)
+        # converter can_convert from type[T] so it should return T. Annotating the result
+        # instead of passing it through typing.cast avoids a function call per JSON-node.
+        res: TargetType = convert(js, target_type, annotations, self.from_json)
+        return res
+
+
+def _resolve_from_json(
+        target_type: Any,
+        converters: Sequence[FromJsonConverter[Any, Any]],
+        converter_by_type: Mapping[Any, FromJsonConverter[Any, Any]],
+        converter_by_origin: Mapping[Any, FromJsonConverter[Any, Any]]
+) -> tuple[ResolvedConverter, Mapping[str, type]]:
+    annotations = get_annotations(target_type) if target_type else {}
+    origin_of_generic = get_origin(target_type)
+    converter = (converter_by_origin.get(origin_of_generic)
+                 if origin_of_generic
+                 else converter_by_type.get(target_type))
+    converter = converter or next((conv for conv in converters if
+                                   conv.can_convert(target_type, origin_of_generic)),
+                                  None)
+    if not converter:
+        raise UnsupportedTargetTypeError(target_type)
+    return converter.convert, annotations
@@ -1,14 +1,16 @@
+from copy import copy
 from inspect import get_annotations
+from pickle import dumps, loads
 from random import choice, choices, gauss, randint, randrange, uniform
 from string import ascii_letters, digits, printable
 from sys import float_info
 from types import NoneType
-from typing import (Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeAlias,
-                    TypedDict, TypeVar, Union, cast)
+from typing import (Any, Callable, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple,
+                    TypeAlias, TypedDict, TypeVar, Union, cast)
 
 from pytest import mark, raises
 
-from jsonype import FromJsonConversionError, TypedJson
+from jsonype import FromJsonConversionError, TypedJson, UnsupportedTargetTypeError
 
 _T = TypeVar("_T")
 
@@ -34,6 +36,32 @@ def test_simple_with_union_type(simple_obj: Union[int, str, None]) -> None:
         simple_obj, cast(type[Optional[Union[int, str]]], Optional[Union[int, str]]))
 
 
+@mark.parametrize(
+    ("js", "ty"),
+    [
+        (True, Union[int, bool]),
+        (1, Union[float, int]),
+        (None, Optional[int]),
+    ],
+)
+def test_simple_with_union_type_returns_value_unchanged(js: Any, ty: Any) -> None:
+    # trying the alternatives in order returns the value unchanged by the first one accepting it
+    res = typed_json.from_json(js, ty)
+    assert res is js
+
+
+@mark.parametrize(
+    ("js", "ty"),
+    [
+        ([1], Literal[[1]]),
+        ([[1]], list[Literal[[1]]]),  # type: ignore[valid-type]
+        ({"k": [1]}, dict[str, Literal[[1]]]),  # type: ignore[valid-type]
+    ],
+)
+def test_literal_with_unhashable_value(js: Any, ty: Any) -> None:
+    assert typed_json.from_json(js, ty) == js
+
+
 @mark.parametrize(
     ("li", "ty"),
     [
@@ -48,6 +76,19 @@ def test_homogeneous_list(li: Sequence[Any], ty: TypeAlias) -> None:
     assert_can_convert_from_to_json(li, list[ty])
 
 
+@mark.parametrize(
+    ("js", "ty"),
+    [
+        ([0, "1"], list[int]),
+        ([1, 0.5], list[float]),
+        ({"k1": True, "k2": None}, dict[str, bool]),
+    ],
+)
+def test_homogeneous_container_fails_on_element_of_other_type(js: Any, ty: type) -> None:
+    with raises(FromJsonConversionError):
+        typed_json.from_json(js, ty)
+
+
 @mark.parametrize("li", [[1], ["Hi"]])
 def test_untyped_list(li: Sequence[Any]) -> None:
     assert_can_convert_from_to_json(li, list)
@@ -58,6 +99,69 @@ def test_inhomogeneous_list() -> None:
                                     list[Union[int, float, bool, None, str]])
 
 
+class _TD(TypedDict):
+    a: int
+
+
+@mark.parametrize(
+    ("js", "ty", "swapped_ty", "expected"),
+    [
+        ([1, 2], Union[tuple[int, ...], list[int]], Union[list[int], tuple[int, ...]], [1, 2]),
+        ({"a": 1, "b": 2}, Union[dict[str, Any], _TD], Union[_TD, dict[str, Any]], {"a": 1}),
+        ([[1]],
+         list[Union[tuple[int, ...], list[int]]],
+         list[Union[list[int], tuple[int, ...]]],
+         [[1]]),
+        ([[1]],
+         tuple[Union[tuple[int, ...], list[int]]],
+         tuple[Union[list[int], tuple[int, ...]]],
+         ([1],)),
+        ([1, [1]],
+         tuple[int, ..., Union[tuple[int, ...], list[int]]],  # type: ignore[misc]
+         tuple[int, ..., Union[list[int], tuple[int, ...]]],  # type: ignore[misc]
+         (1, [1])),
+        ({"k": [1]},
+         dict[str, Union[tuple[int, ...], list[int]]],
+         dict[str, Union[list[int], tuple[int, ...]]],
+         {"k": [1]}),
+    ],
+)
+def test_union_order_independent_of_previous_conversions(
+        js: Any, ty: Any, swapped_ty: Any, expected: Any) -> None:
+    # Unions with swapped type-parameters compare equal, but are tried in a different order
+    assert ty == swapped_ty
+    converter = TypedJson()
+    converter.from_json(js, ty)
+    assert converter.from_json(js, swapped_ty) == expected
+    assert type(converter.from_json(js, swapped_ty)) is type(expected)
+
+
+def test_union_type_resolution_independent_of_previous_conversions() -> None:
+    def outcome(converter: TypedJson) -> Any:
+        try:
+            return converter.from_json(1, int | str)  # type: ignore[arg-type]
+        except Exception as e:  # noqa: BLE001
+            return type(e)
+
+    # int | str compares equal to Union[int, str], so converting one must not change how the
+    # other is converted
+    assert (int | str) == Union[int, str]
+    converter = TypedJson()
+    converter.from_json(1, cast(type, Union[int, str]))
+    assert outcome(converter) == outcome(TypedJson())
+
+
+def test_union_failures_in_order_of_union() -> None:
+    converter = TypedJson()
+    # Union is a type-special-form so cast to type explicitly
+    with raises(FromJsonConversionError):
+        converter.from_json("a", cast(type, Union[float, int]))
+    with raises(FromJsonConversionError) as exc_info:
+        converter.from_json("a", cast(type, Union[int, float]))
+    failures = str(exc_info.value).split(": [", 1)[1]
+    assert failures.index("int") < failures.index("float")
+
+
 def test_inhomogeneous_tuple() -> None:
     assert_can_convert_from_to_json((1, 0., True, None, "Hello"),
                                     tuple[int, float, bool, None, str])
@@ -67,6 +171,11 @@ def test_empty_tuple() -> None:
     assert_can_convert_from_to_json((), tuple[()])
 
 
+def test_tuple_with_multiple_ellipsis_unsupported() -> None:
+    with raises(UnsupportedTargetTypeError):
+        typed_json.from_json([1, 2], tuple[int, ..., ...])  # type: ignore[misc]
+
+
 @mark.parametrize(
     ("m", "ty"),
     [({"k1": 1}, int), ({"k1": True, "k2": False}, bool), ({"k1": None}, NoneType)],
@@ -107,6 +216,51 @@ def test_typed_dict_fail_if_key_missing() -> None:
     assert "k2" in str(exc_info.value)
 
 
+def test_conversion_error_message() -> None:
+    with raises(FromJsonConversionError) as exc_info:
+        typed_json.from_json("x", int)
+    assert exc_info.value.args == ("Cannot convert x to <class 'int'>", "x", int)
+    assert str(exc_info.value) == """("Cannot convert x to <class 'int'>", 'x', <class 'int'>)"""
+    assert repr(exc_info.value) == \
+        """FromJsonConversionError("Cannot convert x to <class 'int'>", 'x', <class 'int'>)"""
+
+
+def test_nested_union_conversion_error_message() -> None:
+    element_type = cast(type, Optional[int])
+    target_type = cast(type, Union[int, list[element_type]])  # type: ignore[valid-type]
+    # a Union reports the failures of its alternatives in its reason
+    expected = FromJsonConversionError(["a"], target_type, str([
+        (int, FromJsonConversionError(["a"], int)),
+        (list[element_type],  # type: ignore[valid-type]
+         FromJsonConversionError("a", element_type, str([
+             (int, FromJsonConversionError("a", int)),
+             (NoneType, FromJsonConversionError("a", NoneType)),
+         ]))),
+    ]))
+    with raises(FromJsonConversionError) as exc_info:
+        typed_json.from_json(["a"], target_type)
+    assert exc_info.value.args == expected.args
+    assert str(exc_info.value) == str(expected)
+    assert repr(exc_info.value) == repr(expected)
+
+
+def _pickle_copy(e: FromJsonConversionError) -> FromJsonConversionError:
+    return cast(FromJsonConversionError, loads(dumps(e)))  # noqa: S301
+
+
+@mark.parametrize("duplicate", [copy, _pickle_copy])
+def test_union_conversion_error_can_be_duplicated(
+        duplicate: Callable[[FromJsonConversionError], FromJsonConversionError]
+) -> None:
+    target_type = cast(type, Union[int, list[Optional[int]]])
+    with raises(FromJsonConversionError) as exc_info:
+        typed_json.from_json(["a"], target_type)
+    duplicated = duplicate(exc_info.value)
+    assert type(duplicated) is FromJsonConversionError
+    assert duplicated.args == exc_info.value.args
+    assert repr(duplicated) == repr(exc_info.value)
+
+
 def test_random_objects() -> None:
     for _ in range(500):
         assert_can_convert_from_to_json(*(_random_typed_object(8)))